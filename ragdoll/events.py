@@ -3,7 +3,7 @@ import ragdollc
 
 from ragdollc import registry
 
-from . import viewport, scene, preferences, constants, log
+from . import viewport, scene, preferences, constants, log, upgrade
 from .vendor import bpx
 from .archetypes import (
     solver,
@@ -100,6 +100,12 @@ def install():
     bpx.handlers["selection_changed"].append(on_blender_selection_changed)
     bpx.handlers["depsgraph_changed"].append(on_depsgraph_changed)
 
+    for event in ("object_created",
+                  "object_removed",
+                  "object_unremoved",
+                  "object_destroyed"):
+        bpx.handlers[event].append(viewport.invalidate_solvers)
+
     bpx.unset_called(uninstall)
 
 
@@ -404,6 +410,11 @@ def on_cursor_draw(_mouse_pos):
 
 
 def on_library_added_or_removed():
+    viewport.invalidate_solvers()
+
+    # Linked objects may come from files older than this scene
+    upgrade.invalidate()
+
     # Objects can exist in a linked library, which to the user
     # appears like any other object. Except they are not in the
     # current scene as above, but rather nested in a collection
@@ -448,6 +459,7 @@ def monitor_library_changed(scene, depsgraph):
 
 @bpy.app.handlers.persistent
 def post_file_open(*_args):
+    viewport.invalidate_solvers()
     scene.post_file_open()
     viewport.add_evaluation_reason("file_open")
 
@@ -511,6 +523,7 @@ def pre_frame_changed(*_args):
 @bpx.with_cumulative_timing
 @bpy.app.handlers.persistent
 def post_undo_redo(blscene, *_):
+    viewport.invalidate_solvers()
     scene.post_undo_redo()
     viewport.add_evaluation_reason("undo_redo")
 
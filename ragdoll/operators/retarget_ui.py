@@ -133,6 +133,21 @@ class RetargetWindow(bpy.types.Operator):
         return max(new_row_counts, default_row_count)
 
 
+def is_retarget_window(solver_ui, window) -> bool:
+    """Is `window` the retargeting window opened for this solver?
+
+    Called from panel `poll()`, so keep the common case of no retarget
+    window ever having been opened down to a single string read.
+
+    """
+
+    targets_window = solver_ui.targets_window
+    if not targets_window:
+        return False
+
+    return targets_window == str(hash(window))
+
+
 def open_retarget_window(solver: bpx.BpxType, w: int, h: int, context=None):
 
     context = context or bpy.context
@@ -142,7 +157,7 @@ def open_retarget_window(solver: bpx.BpxType, w: int, h: int, context=None):
     prev_win = None
     if solver_ui.targets_window:
         for win in context.window_manager.windows:
-            if str(hash(win)) == solver_ui.targets_window:
+            if is_retarget_window(solver_ui, win):
                 prev_win = win
                 break
 
@@ -2,8 +2,10 @@ import bpy
 import blf
 
 import os
+import re
 import json
 import fnmatch
+import functools
 
 from ..vendor import bpx
 from . import icons
@@ -206,6 +208,19 @@ def merge_flt_flags(l1, l2):
     return l1 + l2
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_name_pattern(pattern):
+    """Return a compiled matcher for `pattern`, as per `fnmatch.fnmatch()`
+
+    The filter string rarely changes between redraws, so compile it once.
+
+    """
+
+    # Implicitly add heading/trailing wildcards.
+    pattern = os.path.normcase("*" + pattern + "*")
+    return re.compile(fnmatch.translate(pattern)).match
+
+
 def filter_items_by_name(
         pattern,
         bitflag,
@@ -227,19 +242,19 @@ def filter_items_by_name(
     if flags is None:
         flags = [0] * len(items)
 
-    # Implicitly add heading/trailing wildcards.
-    pattern = "*" + pattern + "*"
+    match = _compile_name_pattern(pattern)
+    path = propname.split(".")
+    normcase = os.path.normcase
 
     def get_nested_attr(it):
-        path = propname.split(".")
-        while path:
-            it = getattr(it, path.pop(0), "")
+        for attr in path:
+            it = getattr(it, attr, "")
         return it
 
     for i, item in enumerate(items):
         name = get_nested_attr(item)
         # This is similar to a logical xor
-        if bool(name and fnmatch.fnmatch(name, pattern)) is not bool(reverse):
+        if bool(name and match(normcase(name))) is not bool(reverse):
             flags[i] |= bitflag
     return flags
 
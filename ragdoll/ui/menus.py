@@ -25,10 +25,50 @@ from ..operators import (
 )
 
 
+# Placeholder menu items, as (text, icon) pairs
+_UTILITIES_SOON = (
+    ("Auto Limit", "ORIENTATION_LOCAL"),
+    ("Reset Shape", "MESH_CAPSULE"),
+    ("Reset Origin", "PIVOT_BOUNDBOX"),
+    ("Reset Constraint Frames", "RIGID_BODY_CONSTRAINT"),
+    ("Edit Constraint Frames", "MOD_MESHDEFORM"),
+)
+
+_COLLISIONS_SOON = (
+    ("Assign Collision Group", "MOD_PHYSICS"),
+    ("Add to Collision Group", "MOD_BOOLEAN"),
+    ("Remove from Collision Group", "MOD_EDGESPLIT"),
+)
+
+_SOLVER_SOON = (
+    ("Extract Markers", "PIVOT_ACTIVE"),
+    ("Move to Solver", "PIVOT_MEDIAN"),
+)
+
+_FIELDS_SOON = (
+    ("Air", "FORCE_WIND"),
+    ("Drag", "FORCE_DRAG"),
+    ("Gravity", ("LIGHTPROBE_SPHERE" if bpx.BLENDER_41_plus else
+                 "LIGHTPROBE_CUBEMAP")),
+    ("Newton", "SORTBYEXT"),
+    ("Radial", "PROP_CON"),
+    ("Turbulence", "FORCE_TURBULENCE"),
+    ("Uniform", "FORCE_FORCE"),
+    ("Vortex", "FORCE_VORTEX"),
+    ("Volume Axis", "MESH_CUBE"),
+    ("Volume Curve", "FORCE_CURVE"),
+)
+
+
 def _soon(layout, text, icon):
     layout.operator(_ComingSoon.bl_idname, text=text, icon=icon)
 
 
+def _soon_all(layout, items):
+    for text, icon in items:
+        _soon(layout, text, icon)
+
+
 def _with_ctrl(layout, cls, **kwargs):
     split = layout.split(align=True, factor=0.99)
 
@@ -146,11 +186,7 @@ class RagdollUtilitiesMenu(bpy.types.Menu):
         menu_item(col, record_simulation.ExtractSimulation)
 
         menu_item(col, "  ")
-        _soon(col, "Auto Limit", icon="ORIENTATION_LOCAL")
-        _soon(col, "Reset Shape", icon="MESH_CAPSULE")
-        _soon(col, "Reset Origin", icon="PIVOT_BOUNDBOX")
-        _soon(col, "Reset Constraint Frames", icon="RIGID_BODY_CONSTRAINT")
-        _soon(col, "Edit Constraint Frames", icon="MOD_MESHDEFORM")
+        _soon_all(col, _UTILITIES_SOON)
 
 
 class RagdollSystemMenu(bpy.types.Menu):
@@ -225,15 +261,12 @@ class RagdollEditMenu(bpy.types.Menu):
 
         menu_item(col, "  ")
         menu_item(col, "Collisions")
-        _soon(col, "Assign Collision Group", icon="MOD_PHYSICS")
-        _soon(col, "Add to Collision Group", icon="MOD_BOOLEAN")
-        _soon(col, "Remove from Collision Group", icon="MOD_EDGESPLIT")
+        _soon_all(col, _COLLISIONS_SOON)
 
         menu_item(col, "  ")
         menu_item(col, "Solver")
         menu_item(col, edit_marker.MergeSolvers)
-        _soon(col, "Extract Markers", icon="PIVOT_ACTIVE")
-        _soon(col, "Move to Solver", icon="PIVOT_MEDIAN")
+        _soon_all(col, _SOLVER_SOON)
 
         menu_item(col, "  ")
         menu_item(col, "Cache")
@@ -250,19 +283,7 @@ class RagdollFieldsMenu(bpy.types.Menu):
         layout = self.layout
         col = layout.column()
 
-        icon_Gravity = ("LIGHTPROBE_SPHERE" if bpx.BLENDER_41_plus else
-                        "LIGHTPROBE_CUBEMAP")
-
-        _soon(col, "Air", icon="FORCE_WIND")
-        _soon(col, "Drag", icon="FORCE_DRAG")
-        _soon(col, "Gravity", icon=icon_Gravity)
-        _soon(col, "Newton", icon="SORTBYEXT")
-        _soon(col, "Radial", icon="PROP_CON")
-        _soon(col, "Turbulence", icon="FORCE_TURBULENCE")
-        _soon(col, "Uniform", icon="FORCE_FORCE")
-        _soon(col, "Vortex", icon="FORCE_VORTEX")
-        _soon(col, "Volume Axis", icon="MESH_CUBE")
-        _soon(col, "Volume Curve", icon="FORCE_CURVE")
+        _soon_all(col, _FIELDS_SOON)
 
 
 class RagdollLoggingMenu(bpy.types.Menu):
@@ -96,11 +96,11 @@ class RD_PT_Solver(draw.PropertiesPanel):
     def poll(cls, context):
         xobj = bpx.BpxType(context.object)
         if xobj.type() == "rdSolver":
-            current_window = str(hash(context.window))
-            retarget_window = xobj.handle().rdSolverUi.targets_window
+            solver_ui = xobj.handle().rdSolverUi
             # We do not want any panel except "Targets" if this window is
             # created for Retargeting.
-            return current_window != retarget_window
+            return not retarget_ui.is_retarget_window(solver_ui,
+                                                      context.window)
         return False
 
     def draw_header(self, _):
@@ -129,8 +129,7 @@ class RD_PT_Targets(bpy.types.Panel):
         solver = context.object.rdSolver
         solver_ui = context.object.rdSolverUi
 
-        is_in_window = solver_ui.targets_window == str(hash(context.window))
-        if is_in_window:
+        if retarget_ui.is_retarget_window(solver_ui, context.window):
             # Change row count with the height of retarget window
             row_count = retarget_ui.RetargetWindow.compute_row_count(context)
         else:
@@ -196,6 +195,13 @@ class RD_UL_Targets(bpy.types.UIList):
         constants.MeshShape: "MESH_ICOSPHERE",
     }
 
+    # Keyed by exact wrapper type, sparing an isinstance() per row
+    destination_icons = {
+        bpx.BpxBone: "BONE_DATA",
+        bpx.BpxObject: "MESH_DATA",
+        bpx.BpxArmature: "MESH_DATA",
+    }
+
     def is_valid_marker(self, item):
         if not item.object:
             return False
@@ -223,9 +229,6 @@ class RD_UL_Targets(bpy.types.UIList):
                   active_property,
                   index=0,
                   flt_flag=0):
-        # Always show filter
-        self.use_filter_show = True  # noqa
-
         split = layout.split(factor=0.5)
         src_layout = split.row()
         dst_layout = split.row()
@@ -236,8 +239,7 @@ class RD_UL_Targets(bpy.types.UIList):
         marker = bpx.BpxType(item.object)
 
         dst_name = ""
-        dst_is_bone = False
-        dst_is_object = False
+        dst_icon = "GHOST_DISABLED"
 
         destinations = marker["destinationTransforms"]
         try:
@@ -266,8 +268,7 @@ class RD_UL_Targets(bpy.types.UIList):
             xdst = scene.source_to_object(pointer)
             if xdst.is_alive():
                 dst_name = xdst.name()
-                dst_is_bone = isinstance(xdst, bpx.BpxBone)
-                dst_is_object = isinstance(xdst, bpx.BpxObject)
+                dst_icon = self.destination_icons.get(type(xdst), dst_icon)
 
         icon_shape = marker["shapeType"].read()
         icon_shape = self.marker_shape_icons.get(icon_shape, "MESH_ICOSPHERE")
@@ -285,10 +286,7 @@ class RD_UL_Targets(bpy.types.UIList):
         src_layout.label(text=marker.name(), icon=icon_shape)
 
         # transform icon, name
-        icon = ("BONE_DATA" if dst_is_bone else
-                "MESH_DATA" if dst_is_object else
-                "GHOST_DISABLED")
-        dst_layout.label(text=dst_name, icon=icon)
+        dst_layout.label(text=dst_name, icon=dst_icon)
 
     def draw_filter(self, context, layout):
         solver_ui = context.object.rdSolverUi
@@ -338,6 +336,10 @@ class RD_UL_Targets(bpy.types.UIList):
         )
 
     def filter_items(self, context, data, propname):
+        # Always show filter, set once per redraw rather than per row.
+        # Note that `draw_filter` is only called once this is already on.
+        self.use_filter_show = True  # noqa
+
         solver = data
         members = getattr(solver, propname)
 
@@ -1,5 +1,4 @@
 import bpy
-import math
 import ctypes
 
 
@@ -24,6 +23,9 @@ E_SPACE_TOPBAR = 21
 E_SPACE_STATUSBAR = 22
 E_SPACE_SPREADSHEET = 23
 
+# Resolve the operator once, rather than walking `bpy.ops` on every call
+_window_new = bpy.ops.wm.window_new
+
 
 def create_window(
         width: int,
@@ -74,24 +76,32 @@ def create_window(
     # Those two were just cached values for other computations, therefore we
     # still need to restore them back. The true windowing tasks are done via
     # another beast, GHOST API (Generic Handy Operating System Toolkit).
-
-    window_manager = bpy.context.window_manager
-    window = bpy.context.window
-    screen = bpy.context.screen
+    #
+    # Why not `context.temp_override()`?
+    # Overriding the context can only swap which window and screen the
+    # operator sees, not their sizes, and the spacetype is looked up from
+    # the screen rather than from the context area. The operator already
+    # runs in the current window, so we patch that and leave the context be.
+
+    context = bpy.context
+    window_manager = context.window_manager
+    window = context.window
+    screen = context.screen
     area = screen_find_big_area(screen)
 
-    c_window = _get_content(window.as_pointer(), _WM_WINDOW)
-    c_area = _get_content(area.as_pointer(), _SCREEN_AREA)
+    # Views onto Blender's own memory, writes go straight to the structs
+    c_window = _WM_WINDOW.from_address(window.as_pointer())
+    c_area = _SCREEN_AREA.from_address(area.as_pointer())
 
     original_spacetype = c_area.spacetype
     original_width = c_window.sizex
     original_height = c_window.sizey
 
     c_area.spacetype = space_type
-    c_window.sizex = math.ceil(width / 0.95)
-    c_window.sizey = math.ceil(height / 0.9)
+    c_window.sizex = -(-width * 100 // 95)  # Integer ceil(width / 0.95)
+    c_window.sizey = -(-height * 10 // 9)  # Integer ceil(height / 0.9)
     try:
-        bpy.ops.wm.window_new()
+        _window_new()
     finally:
         c_area.spacetype = original_spacetype
         c_window.sizex = original_width
@@ -109,22 +119,12 @@ def screen_find_big_area(screen: bpy.types.Screen) -> bpy.types.Area:
 
     """
 
-    big = None
-    maxsize = 0
-
-    for area in screen.areas:
-        if area.width >= 0 and area.height >= 0:
-            size = area.width * area.height
-            if size > maxsize:
-                maxsize = size
-                big = area
-
-    return big
-
-
-def _get_content(ptr, type_):
-    _ptr = ctypes.cast(ptr, ctypes.POINTER(type_))
-    return _ptr.contents if _ptr else None
+    # Areas of zero size are never picked, like the original `size > 0`
+    return max(
+        (area for area in screen.areas if area.width > 0 and area.height > 0),
+        key=lambda area: area.width * area.height,
+        default=None,
+    )
 
 
 # Interface for underlying C struct
@@ -133,7 +133,9 @@ def _get_content(ptr, type_):
 #       At least up until the member we want, i.e. spacetype, sizey.
 #       The below was derived from Blender 4.0 (tested in version 3.4)
 #
-_PLACEHOLDER = type("_PLACEHOLDER", (ctypes.Structure,), {})
+# Pointers we never dereference are declared as `c_void_p`, they are
+# only there to reach the members we are after.
+#
 
 # ListBase
 _LIST_BASE = type("_LIST_BASE", (ctypes.Structure,), {
@@ -166,15 +168,15 @@ _RCTI = type("_RCTI", (ctypes.Structure,), {
 # https://github.com/blender/blender/blob/v4.0.0/source/blender/makesdna/DNA_screen_types.h#L367
 _SCREEN_AREA = type("_SCREEN_AREA", (ctypes.Structure,), {
     "_fields_": [
-        ("next", ctypes.POINTER(_PLACEHOLDER)),
-        ("prev", ctypes.POINTER(_PLACEHOLDER)),
-        ("v1", ctypes.POINTER(_PLACEHOLDER)),
-        ("v2", ctypes.POINTER(_PLACEHOLDER)),
-        ("v3", ctypes.POINTER(_PLACEHOLDER)),
-        ("v4", ctypes.POINTER(_PLACEHOLDER)),
-        ("full", ctypes.POINTER(_PLACEHOLDER)),
+        ("next", ctypes.c_void_p),
+        ("prev", ctypes.c_void_p),
+        ("v1", ctypes.c_void_p),
+        ("v2", ctypes.c_void_p),
+        ("v3", ctypes.c_void_p),
+        ("v4", ctypes.c_void_p),
+        ("full", ctypes.c_void_p),
         ("totrct", _RCTI),
-        ("spacetype", ctypes.c_char),
+        ("spacetype", ctypes.c_uint8),
     ]
 })
 
@@ -182,22 +184,22 @@ _SCREEN_AREA = type("_SCREEN_AREA", (ctypes.Structure,), {
 # https://github.com/blender/blender/blob/v4.0.0/source/blender/makesdna/DNA_windowmanager_types.h#L242
 _WM_WINDOW = type("_WM_WINDOW", (ctypes.Structure,), {
     "_fields_": [
-        ("next", ctypes.POINTER(_PLACEHOLDER)),
-        ("prev", ctypes.POINTER(_PLACEHOLDER)),
+        ("next", ctypes.c_void_p),
+        ("prev", ctypes.c_void_p),
         ("ghostwin", ctypes.c_void_p),
         ("gpuctx", ctypes.c_void_p),
-        ("parent", ctypes.POINTER(_PLACEHOLDER)),
-        ("scene", ctypes.POINTER(_PLACEHOLDER)),
-        ("new_scene", ctypes.POINTER(_PLACEHOLDER)),
+        ("parent", ctypes.c_void_p),
+        ("scene", ctypes.c_void_p),
+        ("new_scene", ctypes.c_void_p),
         ("view_layer_name", ctypes.c_char * 64),
-        ("unpinned_scene", ctypes.POINTER(_PLACEHOLDER)),
-        ("workspace_hook", ctypes.POINTER(_PLACEHOLDER)),
+        ("unpinned_scene", ctypes.c_void_p),
+        ("workspace_hook", ctypes.c_void_p),
         ("global_areas", _SCREEN_AREA_MAP),
-        ("screen", ctypes.POINTER(_PLACEHOLDER)),
+        ("screen", ctypes.c_void_p),
         ("winid", ctypes.c_int),
-        ("posx", ctypes.c_short),
-        ("posy", ctypes.c_short),
-        ("sizex", ctypes.c_short),
-        ("sizey", ctypes.c_short),
+        ("posx", ctypes.c_int16),
+        ("posy", ctypes.c_int16),
+        ("sizex", ctypes.c_int16),
+        ("sizey", ctypes.c_int16),
     ]
 })
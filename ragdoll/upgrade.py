@@ -1,30 +1,58 @@
 import bpy
 from .vendor import bpx
 
+# Bump this whenever a new upgrade step is added to `upgrade_all()`
+REVISION = 1
+
+
+def upgrade_all(scene=None):
+    scene = scene or bpy.context.scene
+    Armature = bpy.types.Armature
+    debug = bpx.debug
 
-def upgrade_all():
     # TEMP: Introduced new boneId property
     for marker in bpx.ls(type="rdMarker"):
-        pg = marker.property_group()
-        source = pg.sourceTransform
-        object = source.object
+        source = marker.property_group().sourceTransform
+        obj = source.object
 
-        if not object:
+        if obj is None:
             continue
 
-        if not isinstance(object.data, bpy.types.Armature):
+        if not isinstance(obj.data, Armature):
             continue
 
-        if source.object and source.boneid == "" and source.get("bone"):
-            bone_name = source["bone"]
-            bone = source.object.pose.bones[bone_name]
+        if source.boneid == "" and source.get("bone"):
+            bone = obj.pose.bones[source["bone"]]
             bone = bpx.BpxBone(bone)
             source.boneid = bone.boneid()
-            bpx.debug("Patched up boneid for %s" % bone)
+            debug("Patched up boneid for %s" % bone)
+
+    # Markers may be appended or linked from older files at any time,
+    # so only the scan of every object is skipped once a scene is upgraded.
+    #
+    # Limitation: the stamp is per scene, not per object. Linking a library
+    # drops it, see `invalidate()`, but objects appended from older files
+    # are only patched as their type is first read, by `bpx._bpxtype()`
+    if scene.get("ragdollUpgradeRevision", 0) >= REVISION:
+        return
+
+    get_attr = bpx.get_attr
+    set_bpxtype = bpx._set_bpxtype
 
     for xobj in bpx.ls():
         # TEMP: Backwards compatibility
-        typ = bpx.get_attr(xobj, "bpxType")
+        typ = get_attr(xobj, "bpxType")
         if typ:
-            bpx.debug("Patched up bpxType for %s" % xobj)
-            bpx._set_bpxtype(xobj.handle(), typ)
+            debug("Patched up bpxType for %s" % xobj)
+            set_bpxtype(xobj.handle(), typ)
+
+    # Linked scenes cannot be written to, and are scanned each time
+    if scene.library is None:
+        scene["ragdollUpgradeRevision"] = REVISION
+
+
+def invalidate():
+    """New datablocks arrived, let the next `upgrade_all()` scan again"""
+    for scene in bpy.data.scenes:
+        if scene.library is None:
+            scene.pop("ragdollUpgradeRevision", None)
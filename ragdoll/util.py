@@ -59,17 +59,18 @@ def touch_initial_state(context=None):
     context = context or bpy.context
     current_frame = context.scene.frame_current
     first_start_frame = current_frame
+    get = registry.get
 
     for solver in bpx.ls("rdSolver"):
-        entity = solver.data["entity"]
-        Time = registry.get("TimeComponent", entity)
+        start_frame = get("TimeComponent", solver.data["entity"]).startFrame
 
-        if Time.startFrame < first_start_frame:
-            first_start_frame = Time.startFrame
+        if start_frame < first_start_frame:
+            first_start_frame = start_frame
 
         # Anything affecting the initial state must also be initialised
-        if solver["cache"]:
-            solver["cache"] = 0
+        cache = solver["cache"]
+        if cache.read():
+            cache.write(constants.Off)
 
     # Don't bother if we're already there
     if first_start_frame < current_frame:
@@ -153,8 +154,6 @@ def _infer_geometry(root: bpx.BpxType,
                     geometry=None):
     geometry = geometry or Geometry()
 
-    original = root
-
     # Automatically find children
     if children is constants.Auto:
         children = _find_children(root)
@@ -164,8 +163,9 @@ def _infer_geometry(root: bpx.BpxType,
 
     # Compute root matrix and pos
     #
-    root_tm = root.matrix()  # bpx.Matrix
-    root_tm = _get_inverted_scale_matrix(root) @ root_tm
+    de_scale = _get_inverted_scale_matrix(root)
+    root_matrix = root.matrix()  # bpx.Matrix, also used for scale below
+    root_tm = de_scale @ root_matrix
     root_pos = root_tm.to_translation()  # bpx.Vector
 
     # Compute Length and Orient
@@ -180,7 +180,7 @@ def _infer_geometry(root: bpx.BpxType,
     else:
         # There is a lot we can gather from the childhood
         length, orient = _length_and_orient_from_childhood(
-            root, parent, children)
+            root, parent, children, de_scale)
 
         geometry.length = length
         geometry.orient = orient
@@ -204,18 +204,7 @@ def _infer_geometry(root: bpx.BpxType,
             handle = root.handle()
 
             if isinstance(handle, bpy.types.Object):
-                bbox = handle.bound_box
-                bbox_x = sorted(b[0] for b in bbox)
-                bbox_y = sorted(b[1] for b in bbox)
-                bbox_z = sorted(b[2] for b in bbox)
-
-                extents = bpx.Vector((
-                    bbox_x[-1] - bbox_x[0],
-                    bbox_y[-1] - bbox_y[0],
-                    bbox_z[-1] - bbox_z[0],
-                ))
-
-                radius = sorted([extents.x, extents.y, extents.z])
+                extents, _ = _bbox_extents_and_center(handle.bound_box)
 
                 # A bounding box will be either flat or long
                 # That means 2/3 axes will be similar, and one
@@ -224,7 +213,9 @@ def _infer_geometry(root: bpx.BpxType,
                 # /__________________/|
                 # |__________________|/
                 #
-                radius = radius[1]  # Pick middle one
+                # Pick middle one, i.e. the median of three
+                x, y, z = extents
+                radius = max(min(x, y), min(max(x, y), z))
                 radius *= 0.5  # Width to radius
                 radius *= 0.5  # Controls are typically larger than the model
 
@@ -273,8 +264,7 @@ def _infer_geometry(root: bpx.BpxType,
         geometry.type = constants.CapsuleShape
 
     # Apply possible negative scale to shape rotation
-    # Use `original` in case we're at the tip
-    orig_scale = original.matrix().to_scale()
+    orig_scale = root_matrix.to_scale()
     scale_mtx = (
         bpx.Matrix.Scale(orig_scale[0], 4, bpx.Vector((1, 0, 0))) @
         bpx.Matrix.Scale(orig_scale[1], 4, bpx.Vector((0, 1, 0))) @
@@ -299,19 +289,19 @@ def compute_scene_scale(solver):
 
     """
 
-    positions = []
     markers = []
     for el in solver["members"]:
         # May be disconnected
         if not el.object:
             continue
 
-        object = bpx.BpxType(el.object)
-
-        if object.type() != "rdMarker":
+        # Check the type tag first, only wrap what we'll actually use.
+        # Like BpxType.type(), this honours the legacy bpxType property
+        # of markers from files that are yet to be upgraded
+        if not bpx.is_type(el.object, "rdMarker"):
             continue
 
-        markers.append(object)
+        markers.append(bpx.BpxType(el.object))
 
     if not markers:
         return 1
@@ -329,14 +319,11 @@ def compute_scene_scale(solver):
 
     # Determine scale based on the distance between markers
     else:
-        for marker in markers:
-            source = marker["sourceTransform"].read()
-            mtx = source.matrix()
-            position = mtx.to_translation()
-            positions.append(position)
-
         # Assume transforms are provided in increasing distance from each other
-        max_length = (positions[0] - positions[-1]).length
+        # so only the first and last are of interest.
+        first = markers[0]["sourceTransform"].read().position()
+        last = markers[-1]["sourceTransform"].read().position()
+        max_length = (first - last).length
 
     scene_scale = 1
 
@@ -386,12 +373,19 @@ def _find_geometry_from_lone_transform(root: bpx.BpxType):
     return _interpret_shape(root)
 
 
-def _length_and_orient_from_childhood(root: bpx.BpxType, parent, children):
+def _length_and_orient_from_childhood(root: bpx.BpxType,
+                                      parent,
+                                      children,
+                                      de_scale=None):
     """Return length and orientation from childhood
 
     Use the childhood to look for clues as to how a shape may
     be oriented.
 
+    Arguments:
+        de_scale (Matrix, optional): Inverted scale of `root`, if already
+            computed by the caller
+
     """
 
     if isinstance(children, list):
@@ -413,9 +407,7 @@ def _length_and_orient_from_childhood(root: bpx.BpxType, parent, children):
     #        \
     #         o
     #
-    positions = []
-    for child in children:
-        positions += [child.position()]
+    positions = [child.position() for child in children]
 
     pos2 = bpx.Vector((0, 0, 0))
     for pos in positions:
@@ -429,11 +421,17 @@ def _length_and_orient_from_childhood(root: bpx.BpxType, parent, children):
     #   o
     #   |
     #
-    distances = []
-    for pos in positions + [root_pos]:
-        distances += [(pos - pos2).length]
-    center_index = distances.index(min(distances))
-    center_node = (children + (root,))[center_index]
+    # On a tie, children win over root.
+    center_node = root
+    min_distance = float("inf")
+    for child, pos in zip(children, positions):
+        distance = (pos - pos2).length
+        if distance < min_distance:
+            center_node = child
+            min_distance = distance
+
+    if (root_pos - pos2).length < min_distance:
+        center_node = root
 
     # Roots typically get this, where e.g.
     #
@@ -448,7 +446,9 @@ def _length_and_orient_from_childhood(root: bpx.BpxType, parent, children):
         orient = direction.to_track_quat("X", "Z")
         center_node_pos = center_node.position()
 
-        de_scale = _get_inverted_scale_matrix(root)
+        if de_scale is None:
+            de_scale = _get_inverted_scale_matrix(root)
+
         center_node_pos = de_scale @ center_node_pos
         root_pos = de_scale @ root_pos
 
@@ -457,22 +457,30 @@ def _length_and_orient_from_childhood(root: bpx.BpxType, parent, children):
     return length, orient
 
 
-def _interpret_shape(xobj: bpx.BpxType):
-    """Translate `shape` into marker shape attributes"""
-
-    bbox = xobj.handle().bound_box
-    bbox_x = sorted(b[0] for b in bbox)
-    bbox_y = sorted(b[1] for b in bbox)
-    bbox_z = sorted(b[2] for b in bbox)
+def _bbox_extents_and_center(bbox) -> tuple[bpx.Vector, bpx.Vector]:
+    """Return size along each axis and center of e.g. `Object.bound_box`"""
+    xs, ys, zs = zip(*bbox)
 
     extents = bpx.Vector((
-        bbox_x[-1] - bbox_x[0],
-        bbox_y[-1] - bbox_y[0],
-        bbox_z[-1] - bbox_z[0],
+        max(xs) - min(xs),
+        max(ys) - min(ys),
+        max(zs) - min(zs),
+    ))
+
+    # 0.125 = 1 / 8 corners
+    center = bpx.Vector((
+        sum(xs) * 0.125,
+        sum(ys) * 0.125,
+        sum(zs) * 0.125,
     ))
-    center = 0.125 * sum(
-        (bpx.Vector(b) for b in bbox), bpx.Vector((0, 0, 0))
-    )  # 0.125 = 1 / 8
+
+    return extents, center
+
+
+def _interpret_shape(xobj: bpx.BpxType):
+    """Translate `shape` into marker shape attributes"""
+
+    extents, center = _bbox_extents_and_center(xobj.handle().bound_box)
 
     extents_avg = sum(extents.xyz) / 3
     is_bbox_cubic = all(
@@ -612,35 +620,46 @@ def _hierarchy_bounding_size(root: bpx.BpxObject):
         max_.y = max(max_.y, dist.y)
         max_.z = max(max_.z, dist.z)
 
-    size = [
-        max_.x - min_.x,
-        max_.y - min_.y,
-        max_.z - min_.z,
-    ]
+    size = max_ - min_
 
-    # Keep the smallest value within some sensible range
-    minimum = size.index(min(size))
-    size[minimum] = max(size) * 0.5
+    # Keep the smallest value within some sensible range,
+    # favouring the first axis on ties
+    half_largest = max(size.x, size.y, size.z) * 0.5
 
-    return bpx.Vector(size), center
+    if size.x <= size.y and size.x <= size.z:
+        size.x = half_largest
+    elif size.y <= size.z:
+        size.y = half_largest
+    else:
+        size.z = half_largest
+
+    return size, center
+
+
+# Rather than any old color, limit colors to
+# the first 250 degress, out of 360 total
+# These all fall into a nice pastel-scheme
+# that fits with the overall look of Ragdoll
+_PASTEL_COLORS = tuple(
+    colorsys.hsv_to_rgb(hue / 360, 0.7, 0.7)  # saturation, value
+    for hue in range(250)
+)
 
 
 def random_color():
     """Return a nice random color"""
+    return bpx.Color(random.choice(_PASTEL_COLORS))
 
-    # Rather than any old color, limit colors to
-    # the first 250 degress, out of 360 total
-    # These all fall into a nice pastel-scheme
-    # that fits with the overall look of Ragdoll
-    hue = int(random.random() * 250) / 360
 
-    value = 0.7
-    saturation = 0.7
+# Constants for `reset_constraint_frames()`, these are never modified
+# 180 degree rotations about X and Y
+_FLIP_X = bpx.Quaternion((1, 0, 0), bpx.pi)
+_FLIP_Y = bpx.Quaternion((0, 1, 0), bpx.pi)
 
-    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-    color = bpx.Color(rgb)
-
-    return color
+# Blender always use Y-axis as the primary axis of a joint/bone.
+# But Ragdoll prefers to use the X-axis for twist so here we
+# re-orient constraint frames to align with that.
+_RE_ORIENT = bpx.Matrix.Rotation(bpx.pi / 2, 4, "Z")
 
 
 def reset_constraint_frames(marker: bpx.BpxType, symmetrical=True):
@@ -675,28 +694,24 @@ def reset_constraint_frames(marker: bpx.BpxType, symmetrical=True):
     largest_axis = bpx.Vector((0, 0, 0))
     largest_axis[largest_index] = main_axis[largest_index]
 
-    x_axis = bpx.Vector((1, 0, 0))
-    y_axis = bpx.Vector((0, 1, 0))
-    z_axis = bpx.Vector((0, 0, 1))
-
     if any(axis < 0 for axis in largest_axis):
         if largest_axis.x < 0:
-            flip = bpx.Quaternion(y_axis, bpx.pi)
+            flip = _FLIP_Y
 
         elif largest_axis.y < 0:
-            flip = bpx.Quaternion(x_axis, bpx.pi)
+            flip = _FLIP_X
 
         else:
-            flip = bpx.Quaternion(x_axis, bpx.pi)
+            flip = _FLIP_X
 
         if symmetrical and largest_axis.x < 0:
-            flip = bpx.Quaternion(x_axis, bpx.pi) @ flip
+            flip = _FLIP_X @ flip
 
         if symmetrical and largest_axis.y < 0:
-            flip = bpx.Quaternion(y_axis, bpx.pi) @ flip
+            flip = _FLIP_Y @ flip
 
         if symmetrical and largest_axis.z < 0:
-            flip = bpx.Quaternion(y_axis, bpx.pi) @ flip
+            flip = _FLIP_Y @ flip
 
         child_frame = bpx.Matrix.LocRotScale(
             child_frame.to_translation(),
@@ -707,13 +722,9 @@ def reset_constraint_frames(marker: bpx.BpxType, symmetrical=True):
     # Align parent matrix to wherever the child matrix is
     parent_frame = parent_matrix.inverted_safe() @ child_matrix @ child_frame
 
-    # Blender always use Y-axis as the primary axis of a joint/bone.
-    # But Ragdoll prefers to use the X-axis for twist so here we
-    # re-orient constraint frames to align with that.
-    re_orient = bpx.Matrix.Rotation(bpx.pi / 2, 4, "Z")
-
-    parent_frame @= re_orient
-    child_frame @= re_orient
+    # Align with Ragdoll's X-axis twist, see `_RE_ORIENT`
+    parent_frame @= _RE_ORIENT
+    child_frame @= _RE_ORIENT
 
     marker["limitRange"] = (bpx.pi / 4, bpx.pi / 4, bpx.pi / 4)
     marker["parentFrame"] = parent_frame
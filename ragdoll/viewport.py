@@ -6,8 +6,11 @@ so as to bring the two together.
 """
 
 import bpy
-import bpy_extras.view3d_utils
 
+from bpy_extras.view3d_utils import (
+    region_2d_to_location_3d,
+    region_2d_to_vector_3d,
+)
 from mathutils import Vector
 
 import ragdollc
@@ -16,7 +19,33 @@ from .vendor import bpx
 from . import constants
 from .operators import manipulator
 
-EVALUATION_REASONS = {"initialising"}
+# Whether solvers must be evaluated on next draw, for whatever reason
+EVALUATION_PENDING = True
+
+# Solvers are only drawn in these modes
+_DRAWABLE_MODES = frozenset((bpx.ObjectMode, bpx.PoseMode))
+
+# Navigation gizmo width per `mini_axis_type`, as the preference
+# holding its size and the unscaled spacing around it
+_NAVIGATE_GIZMO_SIZES = {
+    "GIZMO": ("gizmo_size_navigate_v3d", 10),
+    "NONE": (None, 40),
+    "MINIMAL": ("mini_axis_size", 45),
+}
+
+# Solvers of the current scene, see `solvers()`
+_SOLVER_CACHE = {
+    "key": None,
+    "solvers": [],
+}
+
+# Inputs and result of the last call to _frustum_box()
+_FRUSTUM_CACHE = {
+    "inputs": None,
+    "viewMatrix": None,
+    "projectionMatrix": None,
+    "box": None,
+}
 
 
 @bpx.with_cumulative_timing
@@ -27,42 +56,74 @@ def draw():
 
     """
 
-    if bpx.mode() not in (bpx.ObjectMode, bpx.PoseMode):
+    if bpx.mode() not in _DRAWABLE_MODES:
         return
 
-    solvers = []
+    visible = []
 
     # Determine which solvers to draw
-    for xobj in bpx.ls(type="rdSolver"):
+    for xobj in solvers():
         if xobj.visible():
-            solvers.append(xobj)
+            visible.append(xobj)
 
-    if len(solvers) > 0:
-        manipulator.show_workspace_tool()
-    else:
+    if not visible:
         manipulator.hide_workspace_tool()
+        clear_evaluation_reasons()
+        return
+
+    manipulator.show_workspace_tool()
 
-    for solver in solvers:
+    # Reasons are only cleared once all solvers are drawn
+    evaluate = ragdollc.scene.evaluate if should_evaluate() else None
+    draw_entity = ragdollc.viewport.draw
+
+    for solver in visible:
         entity = solver.data["entity"]
 
-        if should_evaluate():
-            ragdollc.scene.evaluate(entity)
+        if evaluate is not None:
+            evaluate(entity)
 
-        ragdollc.viewport.draw(entity)
+        draw_entity(entity)
 
     clear_evaluation_reasons()
 
 
+def solvers():
+    """Return all solvers of the current scene
+
+    Listing walks every object in the scene, so the result is kept
+    until an object is created or removed, or the scene changes.
+
+    """
+
+    blscene = bpy.context.scene
+    key = (blscene.as_pointer(), len(blscene.objects))
+
+    if _SOLVER_CACHE["key"] != key:
+        _SOLVER_CACHE["solvers"] = list(bpx.ls(type="rdSolver"))
+        _SOLVER_CACHE["key"] = key
+
+    return _SOLVER_CACHE["solvers"]
+
+
+def invalidate_solvers(*_args):
+    """Let the next call to solvers() list them anew"""
+    _SOLVER_CACHE["key"] = None
+
+
 def should_evaluate():
-    return len(EVALUATION_REASONS) > 0
+    return EVALUATION_PENDING
 
 
 def clear_evaluation_reasons():
-    EVALUATION_REASONS.clear()
+    global EVALUATION_PENDING
+    EVALUATION_PENDING = False
 
 
 def add_evaluation_reason(reason):
-    EVALUATION_REASONS.add(reason)
+    """Evaluate on next draw, `reason` only documents the call site"""
+    global EVALUATION_PENDING
+    EVALUATION_PENDING = True
 
 
 def save_state():
@@ -75,43 +136,43 @@ def save_state():
 
     ctx = bpy.context
     space = ctx.space_data
-    dpi = ctx.preferences.system.ui_scale
+    preferences = ctx.preferences
+    dpi = preferences.system.ui_scale
 
     display_style = space.shading.type
     show_wireframes = space.overlay.show_wireframes
 
+    # Regions whose height counts towards the header, these
+    # don't change per region so are resolved up-front
+    header_types = ("HEADER",) if constants.BLENDER_4 else ()
+    if space.show_region_tool_header:
+        header_types += ("TOOL_HEADER",)
+
     tools_width = 0
     ui_width = 0
     header_height = 0
     for region in ctx.area.regions:
         if tools_width and header_height and ui_width:
             break
-        if region.type == "TOOLS":
+
+        # Converted from an enum to a new string on every access
+        region_type = region.type
+
+        if region_type == "TOOLS":
             tools_width = region.width
-        elif region.type == "UI":
+        elif region_type == "UI":
             ui_width = region.width
-        elif constants.BLENDER_4 and region.type == "HEADER":
-            header_height += region.height
-        elif region.type == "TOOL_HEADER" and space.show_region_tool_header:
+        elif region_type in header_types:
             header_height += region.height
 
     if space.show_gizmo and space.show_gizmo_navigate:
-        pref_view = ctx.preferences.view
-        mini_axis_type = pref_view.mini_axis_type
-
-        if mini_axis_type == "GIZMO":
-            size = dpi * pref_view.gizmo_size_navigate_v3d
-            spacing = 10 * dpi
-            ui_width += int(size + spacing)
+        pref_view = preferences.view
+        size_pref, spacing = _NAVIGATE_GIZMO_SIZES.get(
+            pref_view.mini_axis_type, _NAVIGATE_GIZMO_SIZES["MINIMAL"]
+        )
 
-        elif mini_axis_type == "NONE":
-            spacing = 40 * dpi
-            ui_width += int(spacing)
-
-        else:  # MINIMAL
-            size = dpi * pref_view.mini_axis_size
-            spacing = 45 * dpi
-            ui_width += int(size + spacing)
+        size = dpi * getattr(pref_view, size_pref) if size_pref else 0
+        ui_width += int(size + spacing * dpi)
 
     else:
         spacing = int(-5 * dpi)
@@ -165,9 +226,34 @@ def restore_state():
 
 @bpx.with_cumulative_timing
 def _frustum_box(context, view_width, view_height):
+    space = context.space_data
+    view_matrix = context.region_data.view_matrix
+    proj_matrix = context.region_data.window_matrix
+    inputs = (view_width, view_height, space.clip_start, space.clip_end)
+
+    # The box only changes with the camera, which is often still
+    cache = _FRUSTUM_CACHE
+    if (cache["inputs"] == inputs and
+            cache["viewMatrix"] == view_matrix and
+            cache["projectionMatrix"] == proj_matrix):
+        return cache["box"]
+
+    # Copies, as these reference the live view
+    cache["inputs"] = inputs
+    cache["viewMatrix"] = view_matrix.copy()
+    cache["projectionMatrix"] = proj_matrix.copy()
+    cache["box"] = _compute_frustum_box(context, view_width, view_height)
+
+    return cache["box"]
+
+
+def _compute_frustum_box(context, view_width, view_height):
     region = context.region
     region_3d = context.space_data.region_3d
-    cam_pos = context.region_data.view_matrix.inverted().to_translation()
+    view_matrix = context.region_data.view_matrix
+
+    # The view matrix is rigid, so its inverse translation is -R^T t
+    cam_pos = view_matrix.to_3x3().transposed() @ -view_matrix.translation
     corners = [
         [0, 0],                     # bottom left
         [0, view_height],           # top left
@@ -176,27 +262,38 @@ def _frustum_box(context, view_width, view_height):
     ]
     mid = [view_width / 2, view_height / 2]
 
-    forward = bpy_extras.view3d_utils.region_2d_to_vector_3d(
-        region, region_3d, mid
-    )
+    forward = region_2d_to_vector_3d(region, region_3d, mid)
 
     near = cam_pos + (forward * context.space_data.clip_start)
     far = cam_pos + (forward * context.space_data.clip_end)
 
     points = []
-    for p in corners:
-        f = bpy_extras.view3d_utils.region_2d_to_location_3d(
-            region, region_3d, p, far)
-        n = bpy_extras.view3d_utils.region_2d_to_location_3d(
-            region, region_3d, p, near)
-        points.append(f)
-        points.append(n)
-
-    min_x = min(p[0] for p in points)
-    min_y = min(p[1] for p in points)
-    min_z = min(p[2] for p in points)
-    max_x = max(p[0] for p in points)
-    max_y = max(p[1] for p in points)
-    max_z = max(p[2] for p in points)
-
-    return Vector((min_x, min_y, min_z)), Vector((max_x, max_y, max_z))
+
+    if region_3d.is_perspective:
+        # Every ray starts at the camera, so rather than unprojecting each
+        # corner twice, intersect one ray per corner with both planes
+        # facing the view, like region_2d_to_location_3d() does
+        view_z = view_matrix.to_3x3()[2]
+        near_depth = (near - cam_pos).dot(view_z)
+        far_depth = (far - cam_pos).dot(view_z)
+
+        for p in corners:
+            ray = region_2d_to_vector_3d(region, region_3d, p)
+            facing = ray.dot(view_z)
+            points.append(cam_pos + ray * (far_depth / facing))
+            points.append(cam_pos + ray * (near_depth / facing))
+
+    else:
+        for p in corners:
+            f = region_2d_to_location_3d(region, region_3d, p, far)
+            n = region_2d_to_location_3d(region, region_3d, p, near)
+            points.append(f)
+            points.append(n)
+
+    # Transpose once, such that each reduction runs over a plain tuple
+    xs, ys, zs = zip(*points)
+
+    return (
+        Vector((min(xs), min(ys), min(zs))),
+        Vector((max(xs), max(ys), max(zs))),
+    )